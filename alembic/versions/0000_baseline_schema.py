@@ -0,0 +1,146 @@
+"""Baseline schema, as created by the app's original startup create_all
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0000"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases created by the old startup hook already match this revision;
+    # mark them with `alembic stamp 0000` instead of running it
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("full_name", sa.String(255), nullable=False),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("is_verified", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("last_login", sa.DateTime(timezone=True)),
+        sa.Column("password_reset_token", sa.String(255)),
+        sa.Column("password_reset_expires", sa.DateTime(timezone=True)),
+        sa.Column("verification_token", sa.String(255)),
+        sa.Column("verification_expires", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_is_active", "users", ["is_active"])
+
+    op.create_table(
+        "investments",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column(
+            "investment_type",
+            sa.Enum("TREASURY_NOTE", "TREASURY_BILL", name="investmenttype"),
+            nullable=False,
+        ),
+        sa.Column("description", sa.String(500)),
+        sa.Column("face_value", sa.Numeric(15, 2), nullable=False),
+        sa.Column("purchase_price", sa.Numeric(15, 2), nullable=False),
+        sa.Column("annual_coupon_rate", sa.Numeric(5, 4)),
+        sa.Column("issue_date", sa.Date()),
+        sa.Column("purchase_date", sa.Date(), nullable=False),
+        sa.Column("maturity_date", sa.Date(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("ACTIVE", "MATURED", "SOLD", "CANCELLED", name="investmentstatus"),
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name="investments_user_id_fkey", ondelete="CASCADE"
+        ),
+    )
+    op.create_index("ix_investments_user_id", "investments", ["user_id"])
+    op.create_index("ix_investments_maturity_date", "investments", ["maturity_date"])
+    op.create_index("ix_investments_status", "investments", ["status"])
+
+    op.create_table(
+        "payment_schedules",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("investment_id", sa.String(36), nullable=False),
+        sa.Column("payment_date", sa.Date(), nullable=False),
+        sa.Column("payment_amount", sa.Numeric(15, 2), nullable=False),
+        sa.Column(
+            "payment_type",
+            sa.Enum("COUPON", "PRINCIPAL", "FINAL_PAYMENT", name="paymenttype"),
+            nullable=False,
+        ),
+        sa.Column(
+            "payment_status",
+            sa.Enum("PENDING", "DUE", "PAID", "OVERDUE", name="paymentstatus"),
+        ),
+        sa.Column("description", sa.String(255)),
+        sa.Column("actual_payment_date", sa.Date()),
+        sa.Column("actual_payment_amount", sa.Numeric(15, 2)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(
+            ["investment_id"], ["investments.id"],
+            name="payment_schedules_investment_id_fkey", ondelete="CASCADE"
+        ),
+    )
+    op.create_index("ix_payment_schedules_investment_id", "payment_schedules", ["investment_id"])
+    op.create_index("ix_payment_schedules_payment_date", "payment_schedules", ["payment_date"])
+    op.create_index("ix_payment_schedules_payment_status", "payment_schedules", ["payment_status"])
+
+    op.create_table(
+        "user_sessions",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column("session_token", sa.String(255), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("last_accessed", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("ip_address", sa.String(45)),
+        sa.Column("user_agent", sa.Text()),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name="user_sessions_user_id_fkey", ondelete="CASCADE"
+        ),
+    )
+    op.create_index("ix_user_sessions_user_id", "user_sessions", ["user_id"])
+    op.create_index("ix_user_sessions_session_token", "user_sessions", ["session_token"], unique=True)
+    op.create_index("ix_user_sessions_expires_at", "user_sessions", ["expires_at"])
+
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36)),
+        sa.Column("table_name", sa.String(50), nullable=False),
+        sa.Column("record_id", sa.String(36), nullable=False),
+        sa.Column("action", sa.String(20), nullable=False),
+        sa.Column("old_values", sa.Text()),
+        sa.Column("new_values", sa.Text()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("ip_address", sa.String(45)),
+        sa.Column("user_agent", sa.Text()),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name="audit_logs_user_id_fkey", ondelete="SET NULL"
+        ),
+    )
+    op.create_index("ix_audit_logs_user_id", "audit_logs", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("audit_logs")
+    op.drop_table("user_sessions")
+    op.drop_table("payment_schedules")
+    op.drop_table("investments")
+    op.drop_table("users")
+
+    # Postgres keeps the enum types after their tables are gone
+    for enum_name in ("paymentstatus", "paymenttype", "investmentstatus", "investmenttype"):
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
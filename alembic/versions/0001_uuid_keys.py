@@ -0,0 +1,98 @@
+"""Store primary and foreign keys as native UUIDs
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-15 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = "0000"
+branch_labels = None
+depends_on = None
+
+# Key columns per table, parents first
+KEY_COLUMNS = {
+    "users": ["id"],
+    "investments": ["id", "user_id"],
+    "payment_schedules": ["id", "investment_id"],
+    "user_sessions": ["id", "user_id"],
+    "audit_logs": ["id", "user_id"],
+}
+
+# (name, table, column, referenced table, ON DELETE)
+FOREIGN_KEYS = [
+    ("investments_user_id_fkey", "investments", "user_id", "users", "CASCADE"),
+    ("payment_schedules_investment_id_fkey", "payment_schedules", "investment_id", "investments", "CASCADE"),
+    ("user_sessions_user_id_fkey", "user_sessions", "user_id", "users", "CASCADE"),
+    ("audit_logs_user_id_fkey", "audit_logs", "user_id", "users", "SET NULL"),
+]
+
+
+def _drop_foreign_keys() -> None:
+    for name, table, _, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+
+
+def _create_foreign_keys() -> None:
+    for name, table, column, referred_table, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referred_table, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _drop_foreign_keys()
+        for table, columns in KEY_COLUMNS.items():
+            for column in columns:
+                op.alter_column(
+                    table, column,
+                    type_=sa.Uuid(),
+                    existing_type=sa.String(36),
+                    postgresql_using=f"{column}::uuid",
+                )
+        _create_foreign_keys()
+        return
+
+    # SQLite stores Uuid as 32 hex characters: strip the dashes, then retype the
+    # columns (batch mode rebuilds each table along with its foreign keys)
+    for table, columns in KEY_COLUMNS.items():
+        op.execute(
+            f"UPDATE {table} SET "
+            + ", ".join(f"{column} = replace({column}, '-', '')" for column in columns)
+        )
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, type_=sa.Uuid(), existing_type=sa.String(36))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _drop_foreign_keys()
+        for table, columns in KEY_COLUMNS.items():
+            for column in columns:
+                op.alter_column(
+                    table, column,
+                    type_=sa.String(36),
+                    existing_type=sa.Uuid(),
+                    postgresql_using=f"{column}::text",
+                )
+        _create_foreign_keys()
+        return
+
+    for table, columns in KEY_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, type_=sa.String(36), existing_type=sa.Uuid())
+        op.execute(
+            f"UPDATE {table} SET "
+            + ", ".join(
+                f"{column} = substr({column}, 1, 8) || '-' || substr({column}, 9, 4) || '-' || "
+                f"substr({column}, 13, 4) || '-' || substr({column}, 17, 4) || '-' || "
+                f"substr({column}, 21)"
+                for column in columns
+            )
+        )
@@ -0,0 +1,35 @@
+"""Composite indexes for session and payment schedule lookups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (user_id, expires_at) serves both the per-user listing and expiry cleanup
+    op.drop_index("ix_user_sessions_user_id", table_name="user_sessions")
+    op.create_index("ix_sessions_user_expires", "user_sessions", ["user_id", "expires_at"])
+
+    # (investment_id, payment_date) serves the ordered per-investment schedule
+    op.drop_index("ix_payment_schedules_investment_id", table_name="payment_schedules")
+    op.create_index(
+        "ix_payments_investment_date", "payment_schedules", ["investment_id", "payment_date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payments_investment_date", table_name="payment_schedules")
+    op.create_index("ix_payment_schedules_investment_id", "payment_schedules", ["investment_id"])
+
+    op.drop_index("ix_sessions_user_expires", table_name="user_sessions")
+    op.create_index("ix_user_sessions_user_id", "user_sessions", ["user_id"])
@@ -0,0 +1,35 @@
+"""Composite indexes for status-filtered investment and payment queries
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (user_id, status) serves the per-user listing and the active-portfolio summary
+    op.drop_index("ix_investments_user_id", table_name="investments")
+    op.create_index("ix_investments_user_status", "investments", ["user_id", "status"])
+
+    # (investment_id, payment_status, payment_date) serves pending/due sums and upcoming payments
+    op.create_index(
+        "ix_payments_investment_status_date",
+        "payment_schedules",
+        ["investment_id", "payment_status", "payment_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payments_investment_status_date", table_name="payment_schedules")
+
+    op.drop_index("ix_investments_user_status", table_name="investments")
+    op.create_index("ix_investments_user_id", "investments", ["user_id"])
@@ -0,0 +1,36 @@
+"""Store user emails lowercased to match the normalised login lookups
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Addresses that differ only by case would collide on the unique email index;
+    # stop before touching anything so they can be merged by hand
+    collisions = op.get_bind().execute(sa.text(
+        "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1"
+    )).scalars().all()
+    if collisions:
+        raise RuntimeError(
+            "Cannot lowercase user emails; these addresses belong to more than one account: "
+            + ", ".join(sorted(collisions))
+        )
+
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+
+def downgrade() -> None:
+    # The original casing is not kept, so there is nothing to restore
+    pass
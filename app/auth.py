@@ -1,34 +1,65 @@
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from functools import partial
+from typing import List, Optional, Tuple
+import jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from redis.asyncio import Redis
+import msgpack
 import secrets
 import uuid
-from .database import get_db
+from .cache import (
+    get_redis, redis_dependency, user_cache_key, session_key, user_sessions_key, password_reset_key,
+    USER_CACHE_TTL_SECONDS, PASSWORD_RESET_TTL_SECONDS
+)
+from .config import get_settings
+from .database import get_db, SessionLocal
 from .models import User, UserSession
-from .schemas import TokenData
+from .schemas import CurrentUser, TokenData
 
-# Security configuration
-SECRET_KEY = "your-secret-key-change-this-in-production"  # Should be from environment variable
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24 * 60  # 30 days
+# Security configuration (read once from the settings)
+settings = get_settings()
+SECRET_KEY = settings.secret_key
+ALGORITHM = settings.algorithm
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Sessions live in Redis; set SESSION_AUDIT=1 to also record them in user_sessions
+SESSION_AUDIT_ENABLED = settings.session_audit
+
+# Password hashing (new hashes use argon2; bcrypt hashes are upgraded on login)
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto", bcrypt__rounds=10)
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+# Columns backing CurrentUser; auth lookups skip tokens and other unused columns
+USER_RESPONSE_COLUMNS = (
+    User.id, User.email, User.full_name, User.is_active,
+    User.is_verified, User.created_at, User.last_login
+)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop."""
+    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await run_in_threadpool(pwd_context.hash, password)
+
+# Encoder with the key bytes and JOSE header bound once
+_JWT_HEADER = {"alg": ALGORITHM, "typ": "JWT"}
+_encode_token = partial(
+    jwt.encode,
+    key=_SECRET_KEY_BYTES,
+    algorithm=ALGORITHM,
+    headers=_JWT_HEADER
+)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
@@ -39,39 +70,85 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _encode_token(to_encode)
     return encoded_jwt
 
+# Decoder with the key, algorithm list and required claims bound once
+_decode_token = partial(
+    jwt.decode,
+    key=_SECRET_KEY_BYTES,
+    algorithms=[ALGORITHM],
+    options={"require": ["exp", "sub"]}
+)
+
 def verify_token(token: str) -> Optional[TokenData]:
     """Verify and decode a JWT token."""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-        token_data = TokenData(user_id=user_id)  # Keep as string
+        payload = _decode_token(token)
+        token_data = TokenData(user_id=payload["sub"])
         return token_data
-    except (JWTError, ValueError):
+    except (jwt.PyJWTError, ValueError):
         return None
 
 def generate_reset_token() -> str:
     """Generate a secure random token for password reset."""
     return secrets.token_urlsafe(32)
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+async def issue_password_reset(email: str) -> None:
+    """Store a password reset token in Redis if the email belongs to a user.
+
+    Runs as a background task after the response is sent, so it opens its own
+    database session.
+    """
+    async with SessionLocal() as db:
+        result = await db.execute(select(User.id).where(User.email == email))
+        user_id = result.scalar_one_or_none()
+    
+    if user_id is None:
+        return
+    
+    reset_token = generate_reset_token()
+    await get_redis().setex(
+        password_reset_key(reset_token), PASSWORD_RESET_TTL_SECONDS, str(user_id)
+    )
+    
+    # In a real application, you would send an email here
+    # For demo purposes, we'll just log the token
+    print(f"Password reset token for {email}: {reset_token}")
+
+async def consume_password_reset(token: str) -> Optional[uuid.UUID]:
+    """Return the user id for a reset token, invalidating the token."""
+    user_id = await get_redis().getdel(password_reset_key(token))
+    return uuid.UUID(user_id.decode()) if user_id else None
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
     """Authenticate a user with email and password."""
-    user = db.query(User).filter(User.email == email).first()
+    result = await db.execute(
+        select(User)
+        .options(load_only(*USER_RESPONSE_COLUMNS, User.password_hash))
+        .where(User.email == email)
+    )
+    user = result.scalar_one_or_none()
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await verify_password(password, user.password_hash):
         return None
+    
+    # Rehash legacy bcrypt hashes; the caller's commit persists the new hash
+    if pwd_context.needs_update(user.password_hash):
+        user.password_hash = await get_password_hash(password)
     return user
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user from JWT token."""
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(redis_dependency)
+) -> CurrentUser:
+    """Get the current authenticated user from JWT token.
+
+    The user's public profile is cached in Redis, so a ``CurrentUser`` is
+    returned instead of an ORM ``User``.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -82,9 +159,22 @@ def get_current_user(
     if token_data is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == token_data.user_id).first()
-    if user is None:
-        raise credentials_exception
+    cache_key = user_cache_key(token_data.user_id)
+    cached = await redis.get(cache_key)
+    if cached is not None:
+        user = CurrentUser.model_validate(msgpack.unpackb(cached))
+    else:
+        result = await db.execute(
+            select(*USER_RESPONSE_COLUMNS).where(User.id == token_data.user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise credentials_exception
+        
+        user = CurrentUser.model_validate(row)
+        await redis.setex(
+            cache_key, USER_CACHE_TTL_SECONDS, msgpack.packb(user.model_dump(mode="json"))
+        )
     
     if not user.is_active:
         raise HTTPException(
@@ -94,7 +184,7 @@ def get_current_user(
     
     return user
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
     """Get the current active user."""
     if not current_user.is_active:
         raise HTTPException(
@@ -103,49 +193,97 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
         )
     return current_user
 
-def create_user_session(
-    db: Session, 
-    user_id: str,  # Changed from uuid.UUID to str
+async def create_user_session(
+    db: AsyncSession, 
+    user_id: uuid.UUID,
     token: str, 
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None
-) -> UserSession:
-    """Create a new user session."""
-    expires_at = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    session = UserSession(
-        user_id=user_id,
-        session_token=token,
-        expires_at=expires_at,
-        ip_address=ip_address,
-        user_agent=user_agent
-    )
+) -> dict:
+    """Create a new user session in Redis (and the SQL audit trail if enabled).
+
+    The audit row is only added to the session; the caller commits it together
+    with its own changes.
+    """
+    ttl_seconds = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    session_id = uuid.uuid4()
+    created_at = datetime.utcnow()
+    expires_at = created_at + timedelta(seconds=ttl_seconds)
+    
+    session = {
+        "id": str(session_id),
+        "user_id": str(user_id),
+        "created_at": created_at.isoformat(),
+        "last_accessed": created_at.isoformat(),
+        "expires_at": expires_at.isoformat(),
+        "ip_address": ip_address,
+        "user_agent": user_agent
+    }
+    
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.setex(session_key(token), ttl_seconds, msgpack.packb(session))
+        pipe.sadd(user_sessions_key(user_id), token)
+        pipe.expire(user_sessions_key(user_id), ttl_seconds)
+        await pipe.execute()
+    
+    if SESSION_AUDIT_ENABLED:
+        db.add(UserSession(
+            id=session_id,
+            user_id=user_id,
+            session_token=token,
+            expires_at=expires_at,
+            ip_address=ip_address,
+            user_agent=user_agent
+        ))
     
-    db.add(session)
-    db.commit()
-    db.refresh(session)
     return session
 
-def cleanup_expired_sessions(db: Session) -> int:
-    """Remove expired sessions from the database."""
-    expired_count = db.query(UserSession).filter(
-        UserSession.expires_at < datetime.utcnow()
-    ).delete()
-    db.commit()
-    return expired_count
+async def list_user_sessions(user_id: uuid.UUID) -> List[Tuple[str, dict]]:
+    """Return ``(token, session)`` pairs for every live session of a user."""
+    redis = get_redis()
+    tokens = [token.decode() for token in await redis.smembers(user_sessions_key(user_id))]
+    if not tokens:
+        return []
+    
+    sessions = []
+    expired = []
+    for token, raw in zip(tokens, await redis.mget([session_key(t) for t in tokens])):
+        if raw is None:
+            expired.append(token)
+        else:
+            sessions.append((token, msgpack.unpackb(raw)))
+    
+    # Session keys expire on their own; drop their leftover set members
+    if expired:
+        await redis.srem(user_sessions_key(user_id), *expired)
+    
+    return sessions
 
-def revoke_user_session(db: Session, token: str) -> bool:
+async def cleanup_expired_sessions(db: AsyncSession) -> int:
+    """Remove expired sessions from the SQL audit trail."""
+    # Bulk DELETE; no session objects are loaded, so skip ORM synchronisation
+    stmt = delete(UserSession).where(UserSession.expires_at < datetime.utcnow())
+    result = await db.execute(stmt.execution_options(synchronize_session=False))
+    await db.commit()
+    return result.rowcount
+
+async def revoke_user_session(user_id: uuid.UUID, token: str) -> bool:
     """Revoke a specific user session."""
-    session = db.query(UserSession).filter(UserSession.session_token == token).first()
-    if session:
-        db.delete(session)
-        db.commit()
-        return True
-    return False
-
-def revoke_all_user_sessions(db: Session, user_id: str) -> int:  # Changed from uuid.UUID to str
-    """Revoke all sessions for a specific user."""
-    revoked_count = db.query(UserSession).filter(UserSession.user_id == user_id).delete()
-    db.commit()
-    return revoked_count
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.delete(session_key(token))
+        pipe.srem(user_sessions_key(user_id), token)
+        deleted, _ = await pipe.execute()
+    return deleted > 0
 
+async def revoke_all_user_sessions(user_id: uuid.UUID) -> int:
+    """Revoke all sessions for a specific user."""
+    redis = get_redis()
+    tokens = await redis.smembers(user_sessions_key(user_id))
+    
+    async with redis.pipeline(transaction=True) as pipe:
+        if tokens:
+            pipe.delete(*(session_key(token.decode()) for token in tokens))
+        pipe.delete(user_sessions_key(user_id), user_cache_key(user_id))
+        results = await pipe.execute()
+    
+    return results[0] if tokens else 0
@@ -0,0 +1,45 @@
+from functools import lru_cache
+from redis.asyncio import Redis
+from .config import get_settings
+
+# How long an authenticated user stays cached after a database lookup
+USER_CACHE_TTL_SECONDS = 60
+
+# How long a password reset token stays valid
+PASSWORD_RESET_TTL_SECONDS = 60 * 60
+
+# How long a portfolio summary stays cached (mutations also bump its version)
+PORTFOLIO_SUMMARY_TTL_SECONDS = 30
+
+# Dependency to get the shared Redis client (one connection pool per process)
+@lru_cache(maxsize=1)
+def get_redis() -> Redis:
+    return Redis.from_url(get_settings().redis_url)
+
+# Async wrapper for Depends(); FastAPI runs sync dependencies in the threadpool
+async def redis_dependency() -> Redis:
+    return get_redis()
+
+def user_cache_key(user_id) -> str:
+    """Redis key holding the cached profile of a user."""
+    return f"u:{user_id}"
+
+def session_key(token: str) -> str:
+    """Redis key holding the metadata of a login session."""
+    return f"sess:{token}"
+
+def user_sessions_key(user_id) -> str:
+    """Redis set of the session tokens issued to a user."""
+    return f"sessions:{user_id}"
+
+def password_reset_key(token: str) -> str:
+    """Redis key mapping a password reset token to its user id."""
+    return f"pwreset:{token}"
+
+def portfolio_version_key(user_id) -> str:
+    """Redis counter bumped whenever a user's portfolio changes."""
+    return f"portfolio_ver:{user_id}"
+
+def portfolio_summary_key(user_id, version: int) -> str:
+    """Redis key holding a user's portfolio summary as of a portfolio version."""
+    return f"portfolio:{user_id}:{version}"
@@ -1,20 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from typing import Optional
 import uuid
 
+from ..cache import get_redis, user_cache_key
 from ..database import get_db
-from ..models import User, UserSession
+from ..models import User
 from ..schemas import (
-    UserCreate, UserLogin, UserResponse, Token, 
+    CurrentUser, UserCreate, UserLogin, UserResponse, Token, 
     PasswordReset, PasswordResetConfirm, SuccessResponse, ErrorResponse
 )
 from ..auth import (
     authenticate_user, create_access_token, get_password_hash, 
     get_current_user, create_user_session, revoke_user_session,
-    revoke_all_user_sessions, generate_reset_token, verify_password
+    revoke_all_user_sessions, list_user_sessions, issue_password_reset,
+    consume_password_reset, verify_password, ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -24,11 +27,12 @@ security = HTTPBearer()
 async def register_user(
     user_data: UserCreate,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Register a new user."""
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    existing_user = result.scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -36,7 +40,7 @@ async def register_user(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
     db_user = User(
         email=user_data.email,
         password_hash=hashed_password,
@@ -45,8 +49,8 @@ async def register_user(
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
@@ -54,10 +58,10 @@ async def register_user(
 async def login_user(
     user_credentials: UserLogin,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Authenticate user and return access token."""
-    user = authenticate_user(db, user_credentials.email, user_credentials.password)
+    user = await authenticate_user(db, user_credentials.email, user_credentials.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,19 +76,21 @@ async def login_user(
         )
     
     # Create access token
-    access_token_expires = timedelta(minutes=30 * 24 * 60)  # 30 days
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": str(user.id)}, expires_delta=access_token_expires
     )
     
-    # Create user session
+    # Create user session and update last login in a single transaction
     ip_address = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
-    create_user_session(db, user.id, access_token, ip_address, user_agent)
+    await create_user_session(db, user.id, access_token, ip_address, user_agent)
     
-    # Update last login
     user.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
+    
+    # The cached profile carries last_login; drop it so /me sees this login
+    await get_redis().delete(user_cache_key(user.id))
     
     return {
         "access_token": access_token,
@@ -95,13 +101,12 @@ async def login_user(
 
 @router.post("/logout", response_model=SuccessResponse)
 async def logout_user(
-    current_user: User = Depends(get_current_user),
-    credentials = Depends(security),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    credentials = Depends(security)
 ):
     """Logout user and revoke current session."""
     token = credentials.credentials
-    revoked = revoke_user_session(db, token)
+    revoked = await revoke_user_session(current_user.id, token)
     
     if revoked:
         return {"message": "Successfully logged out"}
@@ -110,50 +115,40 @@ async def logout_user(
 
 @router.post("/logout-all", response_model=SuccessResponse)
 async def logout_all_sessions(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Logout user from all sessions."""
-    revoked_count = revoke_all_user_sessions(db, current_user.id)
+    revoked_count = await revoke_all_user_sessions(current_user.id)
     return {"message": f"Successfully logged out from {revoked_count} sessions"}
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: CurrentUser = Depends(get_current_user)):
     """Get current user information."""
     return current_user
 
 @router.post("/forgot-password", response_model=SuccessResponse)
 async def forgot_password(
     password_reset: PasswordReset,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks
 ):
     """Request password reset token."""
-    user = db.query(User).filter(User.email == password_reset.email).first()
-    
-    # Always return success to prevent email enumeration
-    if user:
-        # Generate reset token
-        reset_token = generate_reset_token()
-        user.password_reset_token = reset_token
-        user.password_reset_expires = datetime.utcnow() + timedelta(hours=1)
-        db.commit()
-        
-        # In a real application, you would send an email here
-        # For demo purposes, we'll just log the token
-        print(f"Password reset token for {user.email}: {reset_token}")
+    # The lookup runs after the response, so every request takes the same path
+    # and the response time does not reveal whether the email exists
+    background_tasks.add_task(issue_password_reset, password_reset.email)
     
     return {"message": "If the email exists, a password reset link has been sent"}
 
 @router.post("/reset-password", response_model=SuccessResponse)
 async def reset_password(
     password_reset_confirm: PasswordResetConfirm,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Reset password using reset token."""
-    user = db.query(User).filter(
-        User.password_reset_token == password_reset_confirm.token,
-        User.password_reset_expires > datetime.utcnow()
-    ).first()
+    user_id = await consume_password_reset(password_reset_confirm.token)
+    user = None
+    if user_id:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
     
     if not user:
         raise HTTPException(
@@ -162,14 +157,12 @@ async def reset_password(
         )
     
     # Update password
-    user.password_hash = get_password_hash(password_reset_confirm.new_password)
-    user.password_reset_token = None
-    user.password_reset_expires = None
+    user.password_hash = await get_password_hash(password_reset_confirm.new_password)
     
     # Revoke all existing sessions
-    revoke_all_user_sessions(db, user.id)
+    await revoke_all_user_sessions(user.id)
     
-    db.commit()
+    await db.commit()
     
     return {"message": "Password successfully reset"}
 
@@ -177,72 +170,69 @@ async def reset_password(
 async def change_password(
     current_password: str,
     new_password: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Change user password."""
+    # The cached current user carries no password hash, so load the row
+    result = await db.execute(select(User).where(User.id == current_user.id))
+    user = result.scalar_one()
+    
     # Verify current password
-    if not verify_password(current_password, current_user.password_hash):
+    if not await verify_password(current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
     # Update password
-    current_user.password_hash = get_password_hash(new_password)
+    user.password_hash = await get_password_hash(new_password)
     
-    # Revoke all other sessions (keep current session active)
-    db.query(UserSession).filter(
-        UserSession.user_id == current_user.id
-    ).delete()
+    await db.commit()
     
-    db.commit()
+    # Revoke all sessions, which also drops the cached user
+    await revoke_all_user_sessions(current_user.id)
     
     return {"message": "Password successfully changed"}
 
 @router.get("/sessions", response_model=list)
 async def get_user_sessions(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get all active sessions for the current user."""
-    sessions = db.query(UserSession).filter(
-        UserSession.user_id == current_user.id,
-        UserSession.expires_at > datetime.utcnow()
-    ).all()
+    sessions = await list_user_sessions(current_user.id)
     
     return [
         {
-            "id": str(session.id),
-            "created_at": session.created_at,
-            "last_accessed": session.last_accessed,
-            "expires_at": session.expires_at,
-            "ip_address": str(session.ip_address) if session.ip_address else None,
-            "user_agent": session.user_agent
+            "id": session["id"],
+            "created_at": session["created_at"],
+            "last_accessed": session["last_accessed"],
+            "expires_at": session["expires_at"],
+            "ip_address": session["ip_address"],
+            "user_agent": session["user_agent"]
         }
-        for session in sessions
+        for _, session in sessions
     ]
 
 @router.delete("/sessions/{session_id}", response_model=SuccessResponse)
 async def revoke_session(
     session_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Revoke a specific session."""
-    session = db.query(UserSession).filter(
-        UserSession.id == session_id,
-        UserSession.user_id == current_user.id
-    ).first()
+    sessions = await list_user_sessions(current_user.id)
+    token = next(
+        (token for token, session in sessions if session["id"] == str(session_id)),
+        None
+    )
     
-    if not session:
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found"
         )
     
-    db.delete(session)
-    db.commit()
+    await revoke_user_session(current_user.id, token)
     
     return {"message": "Session successfully revoked"}
 
@@ -1,25 +1,40 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from pydantic import (
+    BaseModel, ConfigDict, EmailStr, Field, StringConstraints, ValidationInfo, field_validator
+)
+from typing import Annotated, Optional, List
 from datetime import datetime, date
 from decimal import Decimal
 import uuid
 from .models import InvestmentType, InvestmentStatus, PaymentType, PaymentStatus
 
+# Constrained string types
+FullName = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+Password = Annotated[str, StringConstraints(min_length=6, max_length=100)]
+InvestmentDescription = Annotated[str, StringConstraints(max_length=500)]
+PaymentDescription = Annotated[str, StringConstraints(max_length=255)]
+# Login-path emails skip EmailStr's validation and are only normalised
+LoginEmail = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True, max_length=255)]
+
 # Base schemas
 class BaseSchema(BaseModel):
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # User schemas
 class UserBase(BaseModel):
     email: EmailStr
-    full_name: str = Field(..., min_length=1, max_length=255)
+    full_name: FullName
+
+    @field_validator('email', mode='after')
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        # Stored lowercase so the unvalidated login emails match
+        return v.lower()
 
 class UserCreate(UserBase):
-    password: str = Field(..., min_length=6, max_length=100)
+    password: Password
 
 class UserUpdate(BaseModel):
-    full_name: Optional[str] = Field(None, min_length=1, max_length=255)
+    full_name: Optional[FullName] = None
     email: Optional[EmailStr] = None
 
 class UserResponse(UserBase):
@@ -29,12 +44,23 @@ class UserResponse(UserBase):
     created_at: datetime
     last_login: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Authenticated user built on every request; stored emails are trusted, so plain str
+class CurrentUser(BaseModel):
+    id: uuid.UUID
+    email: str
+    full_name: str
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    last_login: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
 
 # Authentication schemas
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: LoginEmail
     password: str
 
 class Token(BaseModel):
@@ -44,19 +70,19 @@ class Token(BaseModel):
     user: UserResponse
 
 class TokenData(BaseModel):
-    user_id: Optional[str] = None
+    user_id: Optional[uuid.UUID] = None
 
 class PasswordReset(BaseModel):
-    email: EmailStr
+    email: LoginEmail
 
 class PasswordResetConfirm(BaseModel):
     token: str
-    new_password: str = Field(..., min_length=6, max_length=100)
+    new_password: Password
 
 # Investment schemas
 class InvestmentBase(BaseModel):
     investment_type: InvestmentType
-    description: Optional[str] = Field(None, max_length=500)
+    description: Optional[InvestmentDescription] = None
     face_value: Decimal = Field(..., gt=0)
     purchase_price: Decimal = Field(..., gt=0)
     annual_coupon_rate: Optional[Decimal] = Field(0.0000, ge=0, le=1)
@@ -64,24 +90,27 @@ class InvestmentBase(BaseModel):
     purchase_date: date
     maturity_date: date
 
-    @validator('maturity_date')
-    def validate_maturity_date(cls, v, values):
-        if 'purchase_date' in values and v <= values['purchase_date']:
+    @field_validator('maturity_date', mode='after')
+    @classmethod
+    def validate_maturity_date(cls, v: date, info: ValidationInfo) -> date:
+        if 'purchase_date' in info.data and v <= info.data['purchase_date']:
             raise ValueError('Maturity date must be after purchase date')
         return v
 
-    @validator('issue_date')
-    def validate_issue_date(cls, v, values):
-        if v and 'purchase_date' in values and v > values['purchase_date']:
+    @field_validator('issue_date', mode='after')
+    @classmethod
+    def validate_issue_date(cls, v: Optional[date], info: ValidationInfo) -> Optional[date]:
+        if v and 'purchase_date' in info.data and v > info.data['purchase_date']:
             raise ValueError('Issue date must be before or equal to purchase date')
         return v
 
-    @validator('annual_coupon_rate')
-    def validate_coupon_rate(cls, v, values):
-        if 'investment_type' in values:
-            if values['investment_type'] == InvestmentType.TREASURY_NOTE and v <= 0:
+    @field_validator('annual_coupon_rate', mode='after')
+    @classmethod
+    def validate_coupon_rate(cls, v: Optional[Decimal], info: ValidationInfo) -> Optional[Decimal]:
+        if 'investment_type' in info.data:
+            if info.data['investment_type'] == InvestmentType.TREASURY_NOTE and v <= 0:
                 raise ValueError('Treasury notes must have a positive coupon rate')
-            elif values['investment_type'] == InvestmentType.TREASURY_BILL and v != 0:
+            elif info.data['investment_type'] == InvestmentType.TREASURY_BILL and v != 0:
                 raise ValueError('Treasury bills should not have a coupon rate')
         return v
 
@@ -89,7 +118,7 @@ class InvestmentCreate(InvestmentBase):
     pass
 
 class InvestmentUpdate(BaseModel):
-    description: Optional[str] = Field(None, max_length=500)
+    description: Optional[InvestmentDescription] = None
     status: Optional[InvestmentStatus] = None
 
 class InvestmentResponse(InvestmentBase):
@@ -99,15 +128,14 @@ class InvestmentResponse(InvestmentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Payment Schedule schemas
 class PaymentScheduleBase(BaseModel):
     payment_date: date
     payment_amount: Decimal = Field(..., gt=0)
     payment_type: PaymentType
-    description: Optional[str] = Field(None, max_length=255)
+    description: Optional[PaymentDescription] = None
 
 class PaymentScheduleResponse(PaymentScheduleBase):
     id: uuid.UUID
@@ -117,8 +145,7 @@ class PaymentScheduleResponse(PaymentScheduleBase):
     actual_payment_amount: Optional[Decimal] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class PaymentScheduleUpdate(BaseModel):
     payment_status: Optional[PaymentStatus] = None
@@ -146,8 +173,7 @@ class UpcomingPayment(BaseModel):
     payment_status: PaymentStatus
     description: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class InvestmentWithPayments(InvestmentResponse):
     payment_schedules: List[PaymentScheduleResponse] = []
@@ -0,0 +1,14 @@
+# Production server settings, picked up automatically by `gunicorn main:app`
+import multiprocessing
+import os
+
+bind = f"[::]:{os.getenv('PORT', '8000')}"
+
+# One uvicorn worker (uvloop + httptools) per core
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+loglevel = "warning"
@@ -1,26 +1,40 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.exc import SQLAlchemyError
+import anyio.to_thread
+import orjson
 import uvicorn
 import os
 
+from .config import get_settings
 from .database import engine, Base
 from .routers import auth, investments
 from .models import *  # Import all models to ensure they're registered
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # Create FastAPI app
 app = FastAPI(
     title="Treasury Investment Tracker API",
     description="A comprehensive API for managing treasury note and bill investments",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
+# Create database tables (opt-in; production schemas are managed by Alembic)
+@app.on_event("startup")
+async def create_tables():
+    if not get_settings().auto_create_tables:
+        return
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+# Size the threadpool that run_in_threadpool (argon2 hashing) draws from
+@app.on_event("startup")
+async def configure_threadpool():
+    anyio.to_thread.current_default_thread_limiter().total_tokens = get_settings().threadpool_size
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -37,65 +51,77 @@ app.include_router(investments.router, prefix="/api/v1")
 # Global exception handlers
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Database error occurred", "error_code": "database_error"}
     )
 
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": str(exc), "error_code": "validation_error"}
     )
 
+# Static endpoint payloads, encoded once at import
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "Treasury Investment Tracker API"})
+
+_ROOT_BYTES = orjson.dumps({
+    "message": "Treasury Investment Tracker API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health"
+})
+
+_INFO_BYTES = orjson.dumps({
+    "name": "Treasury Investment Tracker API",
+    "version": "1.0.0",
+    "description": "API for managing treasury investments in Malawi Kwacha",
+    "features": [
+        "User authentication and authorization",
+        "Treasury note and bill management",
+        "Automatic payment schedule generation",
+        "Portfolio tracking and analytics",
+        "Payment status management"
+    ],
+    "endpoints": {
+        "authentication": "/api/v1/auth",
+        "investments": "/api/v1/investments",
+        "documentation": "/docs"
+    }
+})
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "Treasury Investment Tracker API"}
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 # Root endpoint
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Treasury Investment Tracker API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 # API info endpoint
 @app.get("/api/v1/info")
 async def api_info():
     """API information endpoint."""
-    return {
-        "name": "Treasury Investment Tracker API",
-        "version": "1.0.0",
-        "description": "API for managing treasury investments in Malawi Kwacha",
-        "features": [
-            "User authentication and authorization",
-            "Treasury note and bill management",
-            "Automatic payment schedule generation",
-            "Portfolio tracking and analytics",
-            "Payment status management"
-        ],
-        "endpoints": {
-            "authentication": "/api/v1/auth",
-            "investments": "/api/v1/investments",
-            "documentation": "/docs"
-        }
-    }
+    return Response(_INFO_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
-    # Run the application
+    # Run the application with uvloop + httptools, one worker per core by default
     port = int(os.getenv("PORT", 8000))
+    limit_concurrency = os.getenv("LIMIT_CONCURRENCY")
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
-        log_level="info"
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
+        reload=False,
+        log_level="warning"
     )
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Date, ForeignKey, Text, Enum as SQLEnum, Numeric
+from sqlalchemy import Column, String, Boolean, DateTime, Date, ForeignKey, Text, Enum as SQLEnum, Numeric, Uuid, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -27,11 +27,17 @@ class PaymentStatus(str, enum.Enum):
     PAID = "paid"
     OVERDUE = "overdue"
 
+# Relationships use lazy="raise_on_sql": load them explicitly with selectinload()/joinedload()
+# instead of letting attribute access emit a query per row. Deletes rely on the
+# database-side ON DELETE rules (passive_deletes) rather than loading children first.
+# Investment/PaymentSchedule relationships are stricter (lazy="raise"): any unloaded
+# access fails, even one the identity map could have answered without SQL.
+
 # User model
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=False)
@@ -46,16 +52,16 @@ class User(Base):
     verification_expires = Column(DateTime(timezone=True))
 
     # Relationships
-    investments = relationship("Investment", back_populates="user", cascade="all, delete-orphan")
-    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
-    audit_logs = relationship("AuditLog", back_populates="user")
+    investments = relationship("Investment", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    audit_logs = relationship("AuditLog", back_populates="user", passive_deletes=True, lazy="raise_on_sql")
 
 # Investment model
 class Investment(Base):
     __tablename__ = "investments"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     investment_type = Column(SQLEnum(InvestmentType), nullable=False)
     description = Column(String(500))
     face_value = Column(Numeric(15, 2), nullable=False)
@@ -69,15 +75,19 @@ class Investment(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="investments")
-    payment_schedules = relationship("PaymentSchedule", back_populates="investment", cascade="all, delete-orphan")
+    user = relationship("User", back_populates="investments", lazy="raise")
+    payment_schedules = relationship("PaymentSchedule", back_populates="investment", cascade="all, delete-orphan", passive_deletes=True, lazy="raise", order_by="PaymentSchedule.payment_date")
+
+    __table_args__ = (
+        Index("ix_investments_user_status", "user_id", "status"),
+    )
 
 # Payment Schedule model
 class PaymentSchedule(Base):
     __tablename__ = "payment_schedules"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    investment_id = Column(String(36), ForeignKey("investments.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    investment_id = Column(Uuid, ForeignKey("investments.id", ondelete="CASCADE"), nullable=False)
     payment_date = Column(Date, nullable=False, index=True)
     payment_amount = Column(Numeric(15, 2), nullable=False)
     payment_type = Column(SQLEnum(PaymentType), nullable=False)
@@ -89,14 +99,19 @@ class PaymentSchedule(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    investment = relationship("Investment", back_populates="payment_schedules")
+    investment = relationship("Investment", back_populates="payment_schedules", lazy="raise")
+
+    __table_args__ = (
+        Index("ix_payments_investment_date", "investment_id", "payment_date"),
+        Index("ix_payments_investment_status_date", "investment_id", "payment_status", "payment_date"),
+    )
 
 # User Session model
 class UserSession(Base):
     __tablename__ = "user_sessions"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     session_token = Column(String(255), unique=True, nullable=False, index=True)
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -105,14 +120,18 @@ class UserSession(Base):
     user_agent = Column(Text)
 
     # Relationships
-    user = relationship("User", back_populates="sessions")
+    user = relationship("User", back_populates="sessions", lazy="raise_on_sql")
+
+    __table_args__ = (
+        Index("ix_sessions_user_expires", "user_id", "expires_at"),
+    )
 
 # Audit Log model
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="SET NULL"), index=True)
     table_name = Column(String(50), nullable=False)
     record_id = Column(String(36), nullable=False)
     action = Column(String(20), nullable=False)  # INSERT, UPDATE, DELETE
@@ -123,5 +142,5 @@ class AuditLog(Base):
     user_agent = Column(Text)
 
     # Relationships
-    user = relationship("User", back_populates="audit_logs")
+    user = relationship("User", back_populates="audit_logs", lazy="raise_on_sql")
 
@@ -1,132 +1,195 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from typing import List, Optional
-from datetime import datetime, date
+from functools import lru_cache
+from sqlalchemy import Row, and_, delete, exists, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, selectinload
+from typing import List, Optional, Tuple
+from datetime import datetime, date, timedelta
 from decimal import Decimal
+from dateutil.relativedelta import relativedelta
+from redis.asyncio import Redis
+import msgpack
 import uuid
 
+from ..cache import (
+    redis_dependency, portfolio_summary_key, portfolio_version_key, PORTFOLIO_SUMMARY_TTL_SECONDS
+)
 from ..database import get_db
-from ..models import User, Investment, PaymentSchedule, InvestmentType, InvestmentStatus, PaymentStatus
+from ..models import Investment, PaymentSchedule, InvestmentType, InvestmentStatus, PaymentStatus
 from ..schemas import (
     InvestmentCreate, InvestmentUpdate, InvestmentResponse, InvestmentWithPayments,
     PaymentScheduleResponse, PaymentScheduleUpdate, PortfolioSummary, 
-    PortfolioResponse, UpcomingPayment, SuccessResponse
+    PortfolioResponse, UpcomingPayment, SuccessResponse, CurrentUser
 )
 from ..auth import get_current_user
 
 router = APIRouter(prefix="/investments", tags=["Investments"])
 
-def generate_payment_schedule(db: Session, investment: Investment):
-    """Generate payment schedule for an investment."""
-    # Clear existing payment schedules
-    db.query(PaymentSchedule).filter(PaymentSchedule.investment_id == investment.id).delete()
-    
-    if investment.investment_type == InvestmentType.TREASURY_NOTE:
+@lru_cache(maxsize=4096)
+def _schedule_template(
+    investment_type: InvestmentType,
+    issue_date: Optional[date],
+    maturity_date: date,
+    annual_coupon_rate: Decimal,
+    face_value: Decimal
+) -> Tuple[dict, ...]:
+    """Build the payment rows (without ``investment_id``) for an investment's terms."""
+    rows = []
+    
+    if investment_type == InvestmentType.TREASURY_NOTE:
         # Calculate semi-annual coupon amount
-        coupon_amount = (investment.face_value * investment.annual_coupon_rate) / 2
+        coupon_amount = (face_value * annual_coupon_rate) / 2
         
-        # Generate semi-annual payments starting 6 months from issue date
-        current_date = investment.issue_date
-        payment_count = 0
+        # Semi-annual payment dates, each offset from the issue date
+        months_to_maturity = (
+            (maturity_date.year - issue_date.year) * 12 + maturity_date.month - issue_date.month
+        )
+        dates = [issue_date + relativedelta(months=6 * i) for i in range(1, months_to_maturity // 6 + 1)]
+        if dates and dates[-1] > maturity_date:
+            dates.pop()
+        
+        # The last coupon only carries the principal when it falls on maturity
+        final_coupon = bool(dates) and dates[-1] == maturity_date
+        coupon_dates = dates[:-1] if final_coupon else dates
         
-        # Add 6 months for first payment
-        from dateutil.relativedelta import relativedelta
-        current_date = current_date + relativedelta(months=6)
+        # Regular coupon payments
+        for payment_count, payment_date in enumerate(coupon_dates, 1):
+            rows.append({
+                "payment_date": payment_date,
+                "payment_amount": coupon_amount,
+                "payment_type": "coupon",
+                "description": f"Semi-annual coupon payment #{payment_count}"
+            })
         
-        while current_date <= investment.maturity_date:
-            payment_count += 1
-            
-            if current_date == investment.maturity_date:
-                # Final payment includes coupon + principal
-                payment = PaymentSchedule(
-                    investment_id=investment.id,
-                    payment_date=current_date,
-                    payment_amount=coupon_amount + investment.face_value,
-                    payment_type="final_payment",
-                    description="Final coupon payment + Principal repayment"
-                )
-            else:
-                # Regular coupon payment
-                payment = PaymentSchedule(
-                    investment_id=investment.id,
-                    payment_date=current_date,
-                    payment_amount=coupon_amount,
-                    payment_type="coupon",
-                    description=f"Semi-annual coupon payment #{payment_count}"
-                )
-            
-            db.add(payment)
-            
-            # Move to next payment date (6 months later)
-            current_date = current_date + relativedelta(months=6)
-    
-    elif investment.investment_type == InvestmentType.TREASURY_BILL:
+        if final_coupon:
+            # Final payment includes coupon + principal
+            rows.append({
+                "payment_date": maturity_date,
+                "payment_amount": coupon_amount + face_value,
+                "payment_type": "final_payment",
+                "description": "Final coupon payment + Principal repayment"
+            })
+        else:
+            # Maturity falls between coupon dates (or before the first one)
+            rows.append({
+                "payment_date": maturity_date,
+                "payment_amount": face_value,
+                "payment_type": "principal",
+                "description": "Principal repayment"
+            })
+    
+    elif investment_type == InvestmentType.TREASURY_BILL:
         # Treasury bills have only one payment at maturity
-        payment = PaymentSchedule(
-            investment_id=investment.id,
-            payment_date=investment.maturity_date,
-            payment_amount=investment.face_value,
-            payment_type="principal",
-            description="Treasury bill maturity payment"
+        rows.append({
+            "payment_date": maturity_date,
+            "payment_amount": face_value,
+            "payment_type": "principal",
+            "description": "Treasury bill maturity payment"
+        })
+    
+    return tuple(rows)
+
+async def generate_payment_schedule(db: AsyncSession, investment: Investment, commit: bool = True):
+    """Generate payment schedule for an investment.
+
+    Pass ``commit=False`` to leave the rows in the caller's transaction.
+    """
+    # Clear existing payment schedules
+    await db.execute(delete(PaymentSchedule).where(PaymentSchedule.investment_id == investment.id))
+    
+    # Identical terms share a cached template; only the investment id differs
+    template = _schedule_template(
+        investment.investment_type,
+        investment.issue_date,
+        investment.maturity_date,
+        investment.annual_coupon_rate,
+        investment.face_value
+    )
+    
+    # Insert all rows in one executemany round trip
+    if template:
+        await db.execute(
+            insert(PaymentSchedule),
+            [{**row, "investment_id": investment.id} for row in template]
         )
-        db.add(payment)
     
-    db.commit()
+    if commit:
+        await db.commit()
 
 @router.post("/", response_model=InvestmentResponse, status_code=status.HTTP_201_CREATED)
 async def create_investment(
     investment_data: InvestmentCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(redis_dependency)
 ):
     """Create a new investment."""
     # Create investment
     db_investment = Investment(
         user_id=current_user.id,
-        **investment_data.dict()
+        **investment_data.model_dump()
     )
     
     db.add(db_investment)
-    db.commit()
-    db.refresh(db_investment)
+    await db.flush()
+    
+    # Generate payment schedule in the same transaction
+    await generate_payment_schedule(db, db_investment, commit=False)
     
-    # Generate payment schedule
-    generate_payment_schedule(db, db_investment)
+    await db.commit()
+    await redis.incr(portfolio_version_key(current_user.id))
+    await db.refresh(db_investment)
     
     return db_investment
 
+async def _list_investments(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    status_filter: Optional[InvestmentStatus] = None,
+    investment_type: Optional[InvestmentType] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Row]:
+    """Load a page of the user's investments as plain column rows."""
+    # Rows skip ORM hydration; InvestmentResponse reads them by attribute
+    query = select(*Investment.__table__.c).where(Investment.user_id == user_id)
+    
+    if status_filter:
+        query = query.where(Investment.status == status_filter)
+    
+    if investment_type:
+        query = query.where(Investment.investment_type == investment_type)
+    
+    # Pages can be up to 1000 rows; fetch them from a server-side cursor in batches
+    result = await db.stream(query.offset(skip).limit(limit).execution_options(yield_per=200))
+    return [row async for row in result]
+
 @router.get("/", response_model=List[InvestmentResponse])
 async def get_investments(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
     status_filter: Optional[InvestmentStatus] = Query(None, description="Filter by investment status"),
     investment_type: Optional[InvestmentType] = Query(None, description="Filter by investment type"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return")
 ):
     """Get all investments for the current user."""
-    query = db.query(Investment).filter(Investment.user_id == current_user.id)
-    
-    if status_filter:
-        query = query.filter(Investment.status == status_filter)
-    
-    if investment_type:
-        query = query.filter(Investment.investment_type == investment_type)
-    
-    investments = query.offset(skip).limit(limit).all()
-    return investments
+    return await _list_investments(db, current_user.id, status_filter, investment_type, skip, limit)
 
 @router.get("/{investment_id}", response_model=InvestmentWithPayments)
 async def get_investment(
     investment_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific investment with payment schedules."""
-    investment = db.query(Investment).filter(
-        and_(Investment.id == investment_id, Investment.user_id == current_user.id)
-    ).first()
+    # Payment schedules come from one IN query, ordered by the relationship
+    result = await db.execute(
+        select(Investment)
+        .options(selectinload(Investment.payment_schedules))
+        .where(and_(Investment.id == investment_id, Investment.user_id == current_user.id))
+    )
+    investment = result.scalar_one_or_none()
     
     if not investment:
         raise HTTPException(
@@ -134,27 +197,28 @@ async def get_investment(
             detail="Investment not found"
         )
     
-    # Get payment schedules
-    payment_schedules = db.query(PaymentSchedule).filter(
-        PaymentSchedule.investment_id == investment_id
-    ).order_by(PaymentSchedule.payment_date).all()
-    
-    return {
-        **investment.__dict__,
-        "payment_schedules": payment_schedules
-    }
+    return investment
 
 @router.put("/{investment_id}", response_model=InvestmentResponse)
 async def update_investment(
     investment_id: uuid.UUID,
     investment_update: InvestmentUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(redis_dependency)
 ):
     """Update an investment."""
-    investment = db.query(Investment).filter(
-        and_(Investment.id == investment_id, Investment.user_id == current_user.id)
-    ).first()
+    owned_investment = and_(Investment.id == investment_id, Investment.user_id == current_user.id)
+    update_data = investment_update.model_dump(exclude_unset=True)
+    
+    # Update and read back the row in one statement; an empty body just reads it
+    if update_data:
+        stmt = update(Investment).where(owned_investment).values(**update_data).returning(Investment)
+    else:
+        stmt = select(Investment).where(owned_investment)
+    
+    result = await db.execute(stmt)
+    investment = result.scalar_one_or_none()
     
     if not investment:
         raise HTTPException(
@@ -162,63 +226,65 @@ async def update_investment(
             detail="Investment not found"
         )
     
-    # Update fields
-    update_data = investment_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(investment, field, value)
-    
-    db.commit()
-    db.refresh(investment)
+    await db.commit()
+    await redis.incr(portfolio_version_key(current_user.id))
     
     return investment
 
 @router.delete("/{investment_id}", response_model=SuccessResponse)
 async def delete_investment(
     investment_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(redis_dependency)
 ):
     """Delete an investment."""
-    investment = db.query(Investment).filter(
+    # Ownership check and delete in one statement; payment rows go via ON DELETE CASCADE
+    result = await db.execute(delete(Investment).where(
         and_(Investment.id == investment_id, Investment.user_id == current_user.id)
-    ).first()
+    ).execution_options(synchronize_session=False))
     
-    if not investment:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Investment not found"
         )
     
-    db.delete(investment)
-    db.commit()
+    await db.commit()
+    await redis.incr(portfolio_version_key(current_user.id))
     
     return {"message": "Investment successfully deleted"}
 
 @router.get("/{investment_id}/payments", response_model=List[PaymentScheduleResponse])
 async def get_payment_schedule(
     investment_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
     status_filter: Optional[PaymentStatus] = Query(None, description="Filter by payment status")
 ):
     """Get payment schedule for an investment."""
-    # Verify investment ownership
-    investment = db.query(Investment).filter(
-        and_(Investment.id == investment_id, Investment.user_id == current_user.id)
-    ).first()
+    owned_investment = and_(Investment.id == investment_id, Investment.user_id == current_user.id)
     
-    if not investment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Investment not found"
-        )
-    
-    query = db.query(PaymentSchedule).filter(PaymentSchedule.investment_id == investment_id)
+    # Column rows are enough for PaymentScheduleResponse; ownership is part of the join
+    query = select(*PaymentSchedule.__table__.c).join(
+        Investment, PaymentSchedule.investment_id == Investment.id
+    ).where(owned_investment)
     
     if status_filter:
-        query = query.filter(PaymentSchedule.payment_status == status_filter)
+        query = query.where(PaymentSchedule.payment_status == status_filter)
+    
+    result = await db.execute(query.order_by(PaymentSchedule.payment_date))
+    payments = result.all()
+    
+    # An empty schedule needs a second look to tell "no payments" from "not yours"
+    if not payments:
+        owned = await db.scalar(select(exists().where(owned_investment)))
+        if not owned:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Investment not found"
+            )
     
-    payments = query.order_by(PaymentSchedule.payment_date).all()
     return payments
 
 @router.put("/{investment_id}/payments/{payment_id}", response_model=PaymentScheduleResponse)
@@ -226,28 +292,29 @@ async def update_payment(
     investment_id: uuid.UUID,
     payment_id: uuid.UUID,
     payment_update: PaymentScheduleUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(redis_dependency)
 ):
     """Update a payment schedule entry."""
-    # Verify investment ownership
-    investment = db.query(Investment).filter(
-        and_(Investment.id == investment_id, Investment.user_id == current_user.id)
-    ).first()
+    # Investment ownership is checked in the same statement
+    owned_payment = and_(
+        PaymentSchedule.id == payment_id,
+        PaymentSchedule.investment_id == investment_id,
+        select(Investment.id).where(
+            and_(Investment.id == investment_id, Investment.user_id == current_user.id)
+        ).exists()
+    )
+    update_data = payment_update.model_dump(exclude_unset=True)
     
-    if not investment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Investment not found"
-        )
+    # Update and read back the row in one statement; an empty body just reads it
+    if update_data:
+        stmt = update(PaymentSchedule).where(owned_payment).values(**update_data).returning(PaymentSchedule)
+    else:
+        stmt = select(PaymentSchedule).where(owned_payment)
     
-    # Get payment
-    payment = db.query(PaymentSchedule).filter(
-        and_(
-            PaymentSchedule.id == payment_id,
-            PaymentSchedule.investment_id == investment_id
-        )
-    ).first()
+    result = await db.execute(stmt)
+    payment = result.scalar_one_or_none()
     
     if not payment:
         raise HTTPException(
@@ -255,42 +322,43 @@ async def update_payment(
             detail="Payment not found"
         )
     
-    # Update fields
-    update_data = payment_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(payment, field, value)
-    
-    db.commit()
-    db.refresh(payment)
+    await db.commit()
+    await redis.incr(portfolio_version_key(current_user.id))
     
     return payment
 
-@router.get("/portfolio/summary", response_model=PortfolioSummary)
-async def get_portfolio_summary(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Get portfolio summary for the current user."""
-    # Get all active investments
-    investments = db.query(Investment).filter(
-        and_(Investment.user_id == current_user.id, Investment.status == InvestmentStatus.ACTIVE)
-    ).all()
-    
-    total_investments = len(investments)
-    active_investments = total_investments
-    total_face_value = sum(inv.face_value for inv in investments)
-    total_purchase_price = sum(inv.purchase_price for inv in investments)
+async def _portfolio_summary(db: AsyncSession, user_id: uuid.UUID) -> PortfolioSummary:
+    """Aggregate the user's active investments into a portfolio summary."""
+    active_filter = and_(
+        Investment.user_id == user_id,
+        Investment.status == InvestmentStatus.ACTIVE
+    )
     
-    # Calculate expected returns (sum of all pending/due payments)
-    expected_returns = Decimal('0')
-    for investment in investments:
-        pending_payments = db.query(PaymentSchedule).filter(
+    # Expected returns (sum of all pending/due payments)
+    expected_returns_subquery = (
+        select(func.coalesce(func.sum(PaymentSchedule.payment_amount), 0))
+        .join(Investment, PaymentSchedule.investment_id == Investment.id)
+        .where(
             and_(
-                PaymentSchedule.investment_id == investment.id,
+                active_filter,
                 PaymentSchedule.payment_status.in_([PaymentStatus.PENDING, PaymentStatus.DUE])
             )
-        ).all()
-        expected_returns += sum(payment.payment_amount for payment in pending_payments)
+        )
+        .correlate(None)
+        .scalar_subquery()
+    )
+    
+    # Aggregate everything in the database and fetch a single row
+    result = await db.execute(
+        select(
+            func.count(Investment.id),
+            func.coalesce(func.sum(Investment.face_value), 0),
+            func.coalesce(func.sum(Investment.purchase_price), 0),
+            expected_returns_subquery
+        ).where(active_filter)
+    )
+    total_investments, total_face_value, total_purchase_price, expected_returns = result.one()
+    active_investments = total_investments
     
     expected_profit = expected_returns - total_purchase_price
     portfolio_yield = (expected_profit / total_purchase_price * 100) if total_purchase_price > 0 else Decimal('0')
@@ -305,56 +373,99 @@ async def get_portfolio_summary(
         portfolio_yield=portfolio_yield
     )
 
-@router.get("/portfolio/upcoming-payments", response_model=List[UpcomingPayment])
-async def get_upcoming_payments(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    days_ahead: int = Query(90, ge=1, le=365, description="Number of days to look ahead"),
-    limit: int = Query(50, ge=1, le=100, description="Maximum number of payments to return")
+async def _cached_portfolio_summary(db: AsyncSession, redis: Redis, user_id: uuid.UUID) -> PortfolioSummary:
+    """Return the portfolio summary from Redis, computing and caching it on a miss.
+
+    The version is read before the aggregate runs, so a summary computed while a
+    mutation commits is cached under the old version and never served after it.
+    """
+    version = int(await redis.get(portfolio_version_key(user_id)) or 0)
+    cache_key = portfolio_summary_key(user_id, version)
+    cached = await redis.get(cache_key)
+    if cached is not None:
+        return PortfolioSummary.model_validate(msgpack.unpackb(cached))
+    
+    summary = await _portfolio_summary(db, user_id)
+    await redis.setex(
+        cache_key, PORTFOLIO_SUMMARY_TTL_SECONDS, msgpack.packb(summary.model_dump(mode="json"))
+    )
+    return summary
+
+@router.get("/portfolio/summary", response_model=PortfolioSummary)
+async def get_portfolio_summary(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(redis_dependency)
 ):
-    """Get upcoming payments for the user's portfolio."""
+    """Get portfolio summary for the current user."""
+    return await _cached_portfolio_summary(db, redis, current_user.id)
+
+async def _upcoming_payments(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    days_ahead: int = 90,
+    limit: int = 50
+) -> List[UpcomingPayment]:
+    """Load pending/due payments falling within the next ``days_ahead`` days."""
     end_date = date.today() + timedelta(days=days_ahead)
     
-    payments = db.query(PaymentSchedule, Investment).join(
-        Investment, PaymentSchedule.investment_id == Investment.id
-    ).filter(
-        and_(
-            Investment.user_id == current_user.id,
-            PaymentSchedule.payment_status.in_([PaymentStatus.PENDING, PaymentStatus.DUE]),
-            PaymentSchedule.payment_date >= date.today(),
-            PaymentSchedule.payment_date <= end_date
+    # The filtering join also populates payment.investment (no second JOIN)
+    result = await db.execute(
+        select(PaymentSchedule)
+        .join(PaymentSchedule.investment)
+        .options(contains_eager(PaymentSchedule.investment))
+        .where(
+            and_(
+                Investment.user_id == user_id,
+                PaymentSchedule.payment_status.in_([PaymentStatus.PENDING, PaymentStatus.DUE]),
+                PaymentSchedule.payment_date.between(date.today(), end_date)
+            )
         )
-    ).order_by(PaymentSchedule.payment_date).limit(limit).all()
+        .order_by(PaymentSchedule.payment_date)
+        .limit(limit)
+    )
+    payments = result.scalars().all()
     
     return [
         UpcomingPayment(
             id=payment.id,
             investment_id=payment.investment_id,
-            investment_description=investment.description,
-            investment_type=investment.investment_type,
+            investment_description=payment.investment.description,
+            investment_type=payment.investment.investment_type,
             payment_date=payment.payment_date,
             payment_amount=payment.payment_amount,
             payment_type=payment.payment_type,
             payment_status=payment.payment_status,
             description=payment.description
         )
-        for payment, investment in payments
+        for payment in payments
     ]
 
+@router.get("/portfolio/upcoming-payments", response_model=List[UpcomingPayment])
+async def get_upcoming_payments(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    days_ahead: int = Query(90, ge=1, le=365, description="Number of days to look ahead"),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of payments to return")
+):
+    """Get upcoming payments for the user's portfolio."""
+    return await _upcoming_payments(db, current_user.id, days_ahead, limit)
+
 @router.get("/portfolio/full", response_model=PortfolioResponse)
 async def get_full_portfolio(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(redis_dependency)
 ):
     """Get complete portfolio information."""
     # Get portfolio summary
-    summary = await get_portfolio_summary(current_user, db)
+    summary = await _cached_portfolio_summary(db, redis, current_user.id)
     
     # Get all investments
-    investments = await get_investments(current_user, db)
+    investments = await _list_investments(db, current_user.id)
     
     # Get upcoming payments
-    upcoming_payments = await get_upcoming_payments(current_user, db)
+    upcoming_payments = await _upcoming_payments(db, current_user.id)
     
     return PortfolioResponse(
         summary=summary,
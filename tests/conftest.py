@@ -0,0 +1,21 @@
+import os
+
+# Importing the app builds the engine; keep tests off the configured Postgres
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+
+@pytest.fixture
+def forbid_lazy_loads():
+    """Turn a lazy="raise"/"raise_on_sql" relationship access into a test failure."""
+    @contextmanager
+    def guard():
+        try:
+            yield
+        except InvalidRequestError as exc:
+            pytest.fail(f"Relationship was lazy loaded instead of eager loaded: {exc}")
+    return guard
@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+
+from app.database import Base, SessionLocal, engine
+from app.models import Investment, InvestmentType, User
+from app.routers.investments import _upcoming_payments, generate_payment_schedule, get_investment
+from app.schemas import CurrentUser, InvestmentWithPayments
+
+
+def run(scenario):
+    """Run a test coroutine, closing the engine's connection before the loop ends."""
+    async def main():
+        try:
+            await scenario()
+        finally:
+            await engine.dispose()
+    asyncio.run(main())
+
+
+async def seed_portfolio():
+    """Create a user with a note and a bill; return the user and the note's id."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    issue_date = date.today() - relativedelta(months=3)
+    async with SessionLocal() as db:
+        user = User(email=f"{uuid.uuid4().hex}@example.com", password_hash="x", full_name="Test")
+        db.add(user)
+        await db.flush()
+
+        note = Investment(
+            user_id=user.id,
+            investment_type=InvestmentType.TREASURY_NOTE,
+            face_value=Decimal("1000.00"),
+            purchase_price=Decimal("950.00"),
+            annual_coupon_rate=Decimal("0.1000"),
+            issue_date=issue_date,
+            purchase_date=issue_date,
+            maturity_date=issue_date + relativedelta(years=2)
+        )
+        bill = Investment(
+            user_id=user.id,
+            investment_type=InvestmentType.TREASURY_BILL,
+            face_value=Decimal("500.00"),
+            purchase_price=Decimal("480.00"),
+            purchase_date=date.today(),
+            maturity_date=date.today() + timedelta(days=30)
+        )
+        db.add_all([note, bill])
+        await db.flush()
+        await generate_payment_schedule(db, note, commit=False)
+        await generate_payment_schedule(db, bill, commit=False)
+        await db.commit()
+        await db.refresh(user)
+        return CurrentUser.model_validate(user), note.id
+
+
+def test_get_investment_eager_loads_payment_schedules(forbid_lazy_loads):
+    async def scenario():
+        current_user, investment_id = await seed_portfolio()
+
+        # A fresh session, so nothing is already in the identity map
+        async with SessionLocal() as db:
+            with forbid_lazy_loads():
+                investment = await get_investment(investment_id, current_user, db)
+                response = InvestmentWithPayments.model_validate(investment)
+
+        assert len(response.payment_schedules) == 4
+
+    run(scenario)
+
+
+def test_upcoming_payments_eager_loads_investments(forbid_lazy_loads):
+    async def scenario():
+        current_user, _ = await seed_portfolio()
+
+        async with SessionLocal() as db:
+            with forbid_lazy_loads():
+                payments = await _upcoming_payments(db, current_user.id, days_ahead=365)
+
+        assert {payment.investment_type for payment in payments} == {
+            InvestmentType.TREASURY_NOTE, InvestmentType.TREASURY_BILL
+        }
+
+    run(scenario)
@@ -0,0 +1,60 @@
+from datetime import date
+from decimal import Decimal
+
+from app.models import InvestmentType
+from app.routers.investments import _schedule_template
+
+FACE_VALUE = Decimal("1000.00")
+RATE = Decimal("0.1000")
+COUPON = Decimal("50.00")
+
+
+def note_schedule(issue_date, maturity_date):
+    rows = _schedule_template(InvestmentType.TREASURY_NOTE, issue_date, maturity_date, RATE, FACE_VALUE)
+    return [(row["payment_date"], row["payment_amount"], row["payment_type"]) for row in rows]
+
+
+def test_aligned_maturity_ends_with_final_payment():
+    assert note_schedule(date(2024, 1, 15), date(2025, 7, 15)) == [
+        (date(2024, 7, 15), COUPON, "coupon"),
+        (date(2025, 1, 15), COUPON, "coupon"),
+        (date(2025, 7, 15), COUPON + FACE_VALUE, "final_payment"),
+    ]
+
+
+def test_month_end_dates_do_not_drift():
+    assert note_schedule(date(2024, 8, 31), date(2026, 2, 28)) == [
+        (date(2025, 2, 28), COUPON, "coupon"),
+        (date(2025, 8, 31), COUPON, "coupon"),
+        (date(2026, 2, 28), COUPON + FACE_VALUE, "final_payment"),
+    ]
+
+
+def test_non_aligned_maturity_repays_principal_at_maturity():
+    assert note_schedule(date(2026, 1, 15), date(2028, 3, 15)) == [
+        (date(2026, 7, 15), COUPON, "coupon"),
+        (date(2027, 1, 15), COUPON, "coupon"),
+        (date(2027, 7, 15), COUPON, "coupon"),
+        (date(2028, 1, 15), COUPON, "coupon"),
+        (date(2028, 3, 15), FACE_VALUE, "principal"),
+    ]
+
+
+def test_maturity_day_before_coupon_day_keeps_principal_at_maturity():
+    assert note_schedule(date(2024, 1, 31), date(2025, 1, 30)) == [
+        (date(2024, 7, 31), COUPON, "coupon"),
+        (date(2025, 1, 30), FACE_VALUE, "principal"),
+    ]
+
+
+def test_short_note_still_repays_principal():
+    assert note_schedule(date(2026, 1, 15), date(2026, 4, 15)) == [
+        (date(2026, 4, 15), FACE_VALUE, "principal"),
+    ]
+
+
+def test_treasury_bill_pays_face_value_at_maturity():
+    rows = _schedule_template(InvestmentType.TREASURY_BILL, None, date(2026, 12, 1), Decimal("0"), FACE_VALUE)
+    assert [(row["payment_date"], row["payment_amount"], row["payment_type"]) for row in rows] == [
+        (date(2026, 12, 1), FACE_VALUE, "principal"),
+    ]